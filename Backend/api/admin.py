@@ -1,16 +1,52 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from .models import WasteType, WasteEntry, UserProfile
 
+class EstimatedCountPaginator(Paginator):
+    """Uses the planner's row estimate instead of COUNT(*) for unfiltered
+    changelists on PostgreSQL, where an exact count scans the whole table."""
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 until the table has been analyzed
+            if row and row[0] > self.exact_count_threshold:
+                return int(row[0])
+        return super().count
+
+class LargeTableAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
 @admin.register(WasteType)
 class WasteTypeAdmin(admin.ModelAdmin):
     list_display = ['name', 'recyclable', 'co2_impact']
     list_filter = ['recyclable']
+    search_fields = ['name']
+    ordering = ['name']
 
 @admin.register(WasteEntry)
-class WasteEntryAdmin(admin.ModelAdmin):
+class WasteEntryAdmin(LargeTableAdmin):
     list_display = ['user', 'waste_type', 'quantity', 'unit', 'date']
     list_filter = ['waste_type', 'date']
+    list_select_related = ['user', 'waste_type']
+    raw_id_fields = ['user']
+    autocomplete_fields = ['waste_type']
+    date_hierarchy = 'date'
 
 @admin.register(UserProfile)
-class UserProfileAdmin(admin.ModelAdmin):
-    list_display = ['user', 'location', 'waste_reduction_goal']
\ No newline at end of file
+class UserProfileAdmin(LargeTableAdmin):
+    list_display = ['user', 'location', 'waste_reduction_goal']
+    list_select_related = ['user']
+    raw_id_fields = ['user']
\ No newline at end of file
@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from api.models import WasteEntryTombstone
+
+class Command(BaseCommand):
+    help = 'Delete waste entry tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS'
+
+    def handle(self, *args, **options):
+        deleted, _ = WasteEntryTombstone.objects.filter(
+            deleted_at__lt=WasteEntryTombstone.retention_cutoff()
+        ).delete()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Pruned {deleted} tombstones older than '
+                f'{settings.SYNC_TOMBSTONE_RETENTION_DAYS} days'
+            )
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 15:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+from api.migration_operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('api', '0002_waste_entry_sync'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='wasteentry',
+            index=models.Index(fields=['date'], name='api_wasteen_date_cfeb6e_idx'),
+        ),
+    ]
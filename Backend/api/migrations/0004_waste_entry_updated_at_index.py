@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-19 15:40
+
+from django.db import migrations, models
+
+from api.migration_operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('api', '0003_waste_entry_date_index'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='wasteentry',
+            index=models.Index(fields=['user', 'updated_at'], name='api_wasteen_user_id_28eebf_idx'),
+        ),
+    ]
@@ -1,6 +1,9 @@
+from datetime import timedelta
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.utils import timezone
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 class WasteType(models.Model):
@@ -28,6 +31,13 @@ class WasteEntry(models.Model):
     description = models.TextField(blank=True)
     date = models.DateField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'updated_at']),
+            models.Index(fields=['date']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.waste_type.name} - {self.quantity}"
@@ -42,6 +52,27 @@ class WasteEntry(models.Model):
         else:  # kg
             return self.quantity
 
+class WasteEntryTombstone(models.Model):
+    """Records a deleted WasteEntry so sync clients can drop their copy."""
+    # No FK constraint: tombstones are written while a user's entries are
+    # being cascade-deleted, and are cleaned up once the user row is gone.
+    user = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False)
+    entry_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'deleted_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.entry_id} deleted at {self.deleted_at}"
+    
+    @classmethod
+    def retention_cutoff(cls):
+        """Tombstones before this may have been pruned."""
+        return timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+
 class UserProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     location = models.CharField(max_length=100, blank=True)
@@ -58,4 +89,12 @@ def create_user_profile(sender, instance, created, **kwargs):
 
 @receiver(post_save, sender=User)
 def save_user_profile(sender, instance, **kwargs):
-    instance.userprofile.save()
\ No newline at end of file
+    instance.userprofile.save()
+
+@receiver(post_delete, sender=WasteEntry)
+def record_waste_entry_tombstone(sender, instance, **kwargs):
+    WasteEntryTombstone.objects.create(user_id=instance.user_id, entry_id=instance.pk)
+
+@receiver(post_delete, sender=User)
+def delete_user_tombstones(sender, instance, **kwargs):
+    WasteEntryTombstone.objects.filter(user_id=instance.pk).delete()
\ No newline at end of file
@@ -20,7 +20,7 @@ class WasteEntrySerializer(serializers.ModelSerializer):
     class Meta:
         model = WasteEntry
         fields = ['id', 'user', 'user_username', 'waste_type', 'waste_type_name', 
-                 'quantity', 'unit', 'description', 'date', 'created_at']
+                 'quantity', 'unit', 'description', 'date', 'created_at', 'updated_at']
         
     def create(self, validated_data):
         # The user will be set by the view's perform_create method
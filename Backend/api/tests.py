@@ -1,3 +1,199 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import router
+from django.http import HttpResponse
+from django.test import override_settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from wastewise.replicas import PIN_COOKIE_NAME, ReplicaPinMiddleware
+
+from .models import WasteType, WasteEntry, WasteEntryTombstone
+
+
+class WasteEntrySyncTests(APITestCase):
+    url = '/api/waste-entries/sync/'
+
+    def setUp(self):
+        self.user = User.objects.create_user('alice', 'alice@example.com')
+        self.other_user = User.objects.create_user('bob', 'bob@example.com')
+        self.waste_type = WasteType.objects.create(name='Plastic')
+        self.client.force_authenticate(self.user)
+
+    def create_entry(self, user=None):
+        return WasteEntry.objects.create(
+            user=user or self.user,
+            waste_type=self.waste_type,
+            quantity=1,
+            unit='kg',
+            date=timezone.now().date(),
+        )
+
+    def test_full_snapshot_without_since(self):
+        first = self.create_entry()
+        second = self.create_entry()
+        self.create_entry(user=self.other_user)
+        first.delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry['id'] for entry in response.data['updated']], [second.id])
+        self.assertEqual(response.data['deleted'], [])
+        self.assertIsNotNone(parse_datetime(response.data['token']))
+
+    def test_delta_returns_updated_and_deleted_since_token(self):
+        unchanged = self.create_entry()
+        deleted = self.create_entry()
+        WasteEntry.objects.filter(pk__in=[unchanged.pk, deleted.pk]).update(
+            updated_at=timezone.now() - timedelta(hours=1)
+        )
+        since = (timezone.now() - timedelta(minutes=10)).isoformat()
+
+        created = self.create_entry()
+        deleted_id = deleted.id
+        deleted.delete()
+        self.create_entry(user=self.other_user).delete()
+
+        response = self.client.get(self.url, {'since': since})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry['id'] for entry in response.data['updated']], [created.id])
+        self.assertEqual(response.data['deleted'], [deleted_id])
+
+    def test_token_overlaps_recent_changes(self):
+        entry = self.create_entry()
+        token = self.client.get(self.url).data['token']
+
+        response = self.client.get(self.url, {'since': token})
+
+        self.assertIn(entry.id, [e['id'] for e in response.data['updated']])
+
+    def test_invalid_since_is_rejected(self):
+        for since in ['not-a-date', '2025-13-01T00:00:00Z', '2025-01-01T00:00:00']:
+            with self.subTest(since=since):
+                response = self.client.get(self.url, {'since': since})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=30)
+    def test_token_older_than_retention_requires_full_resync(self):
+        since = (timezone.now() - timedelta(days=31)).isoformat()
+
+        response = self.client.get(self.url, {'since': since})
+
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=30)
+    def test_prune_tombstones_removes_expired_only(self):
+        self.create_entry().delete()
+        WasteEntryTombstone.objects.update(deleted_at=timezone.now() - timedelta(days=31))
+        recent = self.create_entry()
+        recent_id = recent.id
+        recent.delete()
+
+        call_command('prune_tombstones', stdout=StringIO())
+
+        self.assertEqual(
+            list(WasteEntryTombstone.objects.values_list('entry_id', flat=True)),
+            [recent_id],
+        )
+
+    def test_tombstones_removed_with_user(self):
+        self.create_entry()
+        self.create_entry().delete()
+        other_entry = self.create_entry(user=self.other_user)
+        other_entry_id = other_entry.id
+        other_entry.delete()
+
+        user_id = self.user.id
+        self.user.delete()
+
+        self.assertFalse(WasteEntryTombstone.objects.filter(user_id=user_id).exists())
+        self.assertEqual(
+            list(WasteEntryTombstone.objects.values_list('entry_id', flat=True)),
+            [other_entry_id],
+        )
+
+
+@override_settings(DATABASE_REPLICAS={'replica1': {}, 'replica2': {}}, REPLICA_PIN_SECONDS=5)
+class ReplicaRoutingTests(APITestCase):
+    factory = APIRequestFactory()
+
+    def route(self, request):
+        """Run a request through the middleware, recording where reads go."""
+        aliases = []
+
+        def get_response(request):
+            aliases.extend(router.db_for_read(WasteEntry) for _ in range(10))
+            return HttpResponse()
+
+        response = ReplicaPinMiddleware(get_response)(request)
+        return set(aliases), response
+
+    def test_safe_request_reads_from_one_replica(self):
+        aliases, response = self.route(self.factory.get('/api/analytics/'))
+
+        self.assertEqual(len(aliases), 1)
+        self.assertIn(aliases.pop(), ['replica1', 'replica2'])
+        self.assertNotIn(PIN_COOKIE_NAME, response.cookies)
+
+    def test_unsafe_request_uses_default_and_sets_pin(self):
+        aliases, response = self.route(self.factory.post('/api/waste-entries/'))
+
+        self.assertEqual(aliases, {'default'})
+        self.assertEqual(response.cookies[PIN_COOKIE_NAME]['max-age'], 5)
+
+    def test_pinned_request_uses_default(self):
+        request = self.factory.get('/api/analytics/')
+        request.COOKIES[PIN_COOKIE_NAME] = '1'
+
+        aliases, _ = self.route(request)
+
+        self.assertEqual(aliases, {'default'})
+
+    def test_reads_outside_requests_use_default(self):
+        self.assertEqual(router.db_for_read(WasteEntry), 'default')
+        self.assertEqual(router.db_for_write(WasteEntry), 'default')
+
+    @override_settings(DATABASE_REPLICAS={})
+    def test_no_replicas_configured(self):
+        aliases, response = self.route(self.factory.get('/api/analytics/'))
+
+        self.assertEqual(aliases, {'default'})
+        self.assertNotIn(PIN_COOKIE_NAME, response.cookies)
+
+    def test_sync_reads_from_default(self):
+        # The replica aliases are not real connections, so any read routed
+        # to them would fail
+        user = User.objects.create_user('alice', 'alice@example.com')
+        self.client.force_authenticate(user)
+
+        response = self.client.get('/api/waste-entries/sync/', {'since': timezone.now().isoformat()})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_related_objects_follow_instance_database(self):
+        user = User.objects.create_user('alice', 'alice@example.com')
+        entry = WasteEntry.objects.create(
+            user=user,
+            waste_type=WasteType.objects.create(name='Plastic'),
+            quantity=1,
+            unit='kg',
+            date=timezone.now().date(),
+        )
+        loaded = []
+
+        def get_response(request):
+            # Not select_related, so waste_type is fetched lazily
+            row = WasteEntry.objects.using('default').get(pk=entry.pk)
+            loaded.append(row.waste_type.name)
+            return HttpResponse()
+
+        ReplicaPinMiddleware(get_response)(self.factory.get('/api/waste-entries/sync/'))
+
+        self.assertEqual(loaded, ['Plastic'])
@@ -1,17 +1,23 @@
 from rest_framework import viewsets, status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate, login, logout
 from django.db.models import Sum, Count
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.views.decorators.csrf import csrf_exempt
 from datetime import timedelta
-from .models import WasteType, WasteEntry, UserProfile
+from .models import WasteType, WasteEntry, WasteEntryTombstone, UserProfile
 from .serializers import (UserSerializer, WasteTypeSerializer, 
                          WasteEntrySerializer, UserProfileSerializer)
 
+# Sync tokens are issued this far in the past. updated_at is stamped by
+# whichever web instance saves the row, before its transaction commits, so
+# the overlap absorbs slow commits and clock skew between instances.
+SYNC_TOKEN_OVERLAP = timedelta(seconds=30)
+
 # ViewSets for CRUD operations
 class WasteTypeViewSet(viewsets.ModelViewSet):
     queryset = WasteType.objects.all()
@@ -40,6 +46,49 @@ class WasteEntryViewSet(viewsets.ModelViewSet):
         self.perform_create(serializer)
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+    
+    @action(detail=False, methods=['get'])
+    def sync(self, request):
+        """Return entries changed and ids deleted since the given sync token.
+
+        Without ``since`` every entry is returned. Clients store the returned
+        ``token`` and pass it back as ``since`` on their next sync. Tokens
+        overlap by SYNC_TOKEN_OVERLAP, so recent changes are returned again
+        and clients must treat ``updated`` and ``deleted`` as idempotent.
+        Tokens older than the tombstone retention window get 410 Gone; the
+        client must then drop its copy and sync again without ``since``.
+        """
+        # Taken before querying so nothing written meanwhile is skipped next time
+        token = timezone.now() - SYNC_TOKEN_OVERLAP
+        # Token-based reads must never go to a lagging replica: rows missing
+        # there would be older than the token and skipped by every later sync.
+        entries = self.get_queryset().using('default').select_related('user', 'waste_type')
+        deleted = []
+        
+        since_param = request.query_params.get('since')
+        if since_param:
+            try:
+                since = parse_datetime(since_param)
+            except ValueError:
+                since = None
+            if since is None or timezone.is_naive(since):
+                return Response({'error': 'Invalid sync token'}, 
+                               status=status.HTTP_400_BAD_REQUEST)
+            if since < WasteEntryTombstone.retention_cutoff():
+                return Response({'error': 'Sync token expired, full resync required'}, 
+                               status=status.HTTP_410_GONE)
+            entries = entries.filter(updated_at__gte=since)
+            deleted = WasteEntryTombstone.objects.using('default').filter(
+                user=request.user, 
+                deleted_at__gte=since
+            ).values_list('entry_id', flat=True)
+        
+        serializer = self.get_serializer(entries, many=True)
+        return Response({
+            'token': token.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
+            'updated': serializer.data,
+            'deleted': list(deleted),
+        })
 
 class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
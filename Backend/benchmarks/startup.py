@@ -0,0 +1,88 @@
+"""
+Startup benchmark for the WSGI entry points.
+
+Every run starts a fresh interpreter, imports one of the ``wsgi.py`` entry
+points under one settings profile and sends it a single request, reporting
+the import time and the time until that first response is complete.
+
+Usage (from the Backend directory):
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 --path /api/waste-types/
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+PROJECT_DIR = BACKEND_DIR.parent
+
+ENTRY_POINTS = [
+    ('wsgi.py', 'wsgi', PROJECT_DIR),
+    ('Backend/wastewise/wsgi.py', 'wastewise.wsgi', BACKEND_DIR),
+]
+
+SETTINGS_PROFILES = [
+    'wastewise.settings',
+    'wastewise.api_only_settings',
+]
+
+CHILD_SCRIPT = """
+import importlib, json, sys, time
+from wsgiref.util import setup_testing_defaults
+
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+module = importlib.import_module(sys.argv[2])
+imported = time.perf_counter()
+
+environ = {'PATH_INFO': sys.argv[3], 'HTTP_ACCEPT': 'application/json'}
+setup_testing_defaults(environ)
+status = []
+response = module.application(environ, lambda s, h, e=None: status.append(s))
+b''.join(response)
+if hasattr(response, 'close'):
+    response.close()
+responded = time.perf_counter()
+
+print(json.dumps({
+    'import': imported - start,
+    'first_response': responded - start,
+    'status': status[0],
+}))
+"""
+
+
+def run_once(module, sys_path, settings_module, path):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    env.pop('RENDER_EXTERNAL_HOSTNAME', None)
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT, str(sys_path), module, path],
+        env=env, cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--path', default='/api/')
+    args = parser.parse_args()
+
+    print(f"{'entry point':<28}{'settings':<30}{'import ms':>11}{'first resp ms':>15}  status")
+    for label, module, sys_path in ENTRY_POINTS:
+        for settings_module in SETTINGS_PROFILES:
+            results = [run_once(module, sys_path, settings_module, args.path)
+                       for _ in range(args.runs)]
+            import_ms = statistics.median(r['import'] for r in results) * 1000
+            response_ms = statistics.median(r['first_response'] for r in results) * 1000
+            print(f"{label:<28}{settings_module:<30}{import_ms:>11.1f}{response_ms:>15.1f}  "
+                  f"{results[-1]['status']}")
+
+
+if __name__ == '__main__':
+    main()
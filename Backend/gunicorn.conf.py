@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for the wastewise backend.
+
+The application is loaded once in the master (``preload_app``) so every
+worker forks with Django, the URLconf, the views and DRF already imported
+instead of importing them again on its first request.
+"""
+
+preload_app = True
+
+
+def when_ready(server):
+    """Import the URLconf in the master before any worker is forked."""
+    if not server.cfg.preload_app:
+        return
+    from django.urls import get_resolver
+    get_resolver().url_patterns
+
+
+def pre_fork(server, worker):
+    """Never hand a database connection opened in the master to a worker."""
+    if not server.cfg.preload_app:
+        return
+    from django.db import connections
+    connections.close_all()
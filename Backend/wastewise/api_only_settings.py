@@ -0,0 +1,51 @@
+"""
+API-only settings profile.
+
+Builds on the regular settings (or the deployment settings on Render) and
+drops everything a pure JSON API does not need: the admin, messages, static
+files, templates and the DRF browsable API. Workers using this profile import
+noticeably less at boot.
+
+Use it by pointing DJANGO_SETTINGS_MODULE at ``wastewise.api_only_settings``
+for the web process only; management commands such as ``collectstatic`` and
+``createsuperuser`` still need the full settings.
+"""
+
+import os
+
+if 'RENDER_EXTERNAL_HOSTNAME' in os.environ:
+    from .deployment_settings import *
+else:
+    from .settings import *
+
+
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'rest_framework',
+    'corsheaders',
+    'api',
+]
+
+MIDDLEWARE = [
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'wastewise.replicas.ReplicaPinMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+]
+
+ROOT_URLCONF = 'wastewise.api_urls'
+
+# No app here renders HTML
+TEMPLATES = []
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+    ],
+}
@@ -0,0 +1,10 @@
+from django.urls import path, include
+from django.shortcuts import redirect
+
+def root_redirect(request):
+    return redirect('/api/')
+
+urlpatterns = [
+    path('', root_redirect, name='root'),
+    path('api/', include('api.urls')),
+]
@@ -0,0 +1,68 @@
+"""
+Read-replica routing.
+
+Replicas are configured through DATABASE_REPLICA_URLS (see settings.py).
+Reads only go to a replica while ReplicaPinMiddleware is handling a safe
+request (GET, HEAD, OPTIONS); writes, unsafe requests, management commands
+and shells always use ``default``. Each request reads from a single replica
+so its queries see one consistent snapshot.
+
+After a client writes, the middleware sets a short-lived cookie that pins its
+reads to ``default`` so it sees its own writes despite replication lag.
+"""
+
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PIN_COOKIE_NAME = 'db_pin'
+
+_replica = ContextVar('replica', default=None)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        # Related objects are loaded from the database their instance came
+        # from, so rows read from ``default`` never pull relations from a replica
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return _replica.get() or 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Every alias holds the same data
+        return True
+
+
+class ReplicaPinMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        safe = request.method in ('GET', 'HEAD', 'OPTIONS')
+        pinned = PIN_COOKIE_NAME in request.COOKIES
+        replica = None
+        if safe and not pinned:
+            replica = random.choice(list(settings.DATABASE_REPLICAS))
+        token = _replica.set(replica)
+        try:
+            response = self.get_response(request)
+        finally:
+            _replica.reset(token)
+
+        if not safe:
+            response.set_cookie(
+                PIN_COOKIE_NAME, '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
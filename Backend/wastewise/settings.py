@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
-from decouple import config
+import dj_database_url
+from decouple import config, Csv
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -25,6 +26,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'wastewise.replicas.ReplicaPinMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -60,6 +62,24 @@ DATABASES = {
     }
 }
 
+# Optional read replicas, comma separated. Safe requests read from them, see
+# wastewise/replicas.py. Locally a second SQLite file works:
+#   DATABASE_REPLICA_URLS=sqlite:///db_replica.sqlite3
+DATABASE_REPLICAS = {
+    f'replica{index}': dj_database_url.parse(url, conn_max_age=600, test_options={'MIRROR': 'default'})
+    for index, url in enumerate(config('DATABASE_REPLICA_URLS', default='', cast=Csv()), start=1)
+}
+DATABASES.update(DATABASE_REPLICAS)
+
+DATABASE_ROUTERS = ['wastewise.replicas.ReplicaRouter']
+
+# How long a client keeps reading from the primary after it writes
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=5, cast=int)
+
+# Deleted-entry tombstones older than this are removed by
+# `manage.py prune_tombstones`; sync tokens older than it must resync in full
+SYNC_TOMBSTONE_RETENTION_DAYS = config('SYNC_TOMBSTONE_RETENTION_DAYS', default=30, cast=int)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
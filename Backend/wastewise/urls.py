@@ -1,12 +1,7 @@
 from django.contrib import admin
-from django.urls import path, include
-from django.shortcuts import redirect
-
-def root_redirect(request):
-    return redirect('/api/')
+from django.urls import path
+from .api_urls import urlpatterns as api_urlpatterns
 
 urlpatterns = [
-    path('', root_redirect, name='root'),
     path('admin/', admin.site.urls),
-    path('api/', include('api.urls')),
-]
\ No newline at end of file
+] + api_urlpatterns